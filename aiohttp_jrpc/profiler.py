@@ -0,0 +1,101 @@
+""" Slow calls profiler """
+from aiohttp.web import Response
+from collections import deque
+import cProfile
+import io
+import json
+import pstats
+import random
+import sys
+import time
+
+# cProfile is global for interpreter, shared by all profilers
+_active = False
+
+
+class Profiler(object):
+    """
+    Capture cProfile stats of slow or randomly sampled service calls.
+    Profiles are kept in a bounded ring buffer, the oldest are dropped.
+    With threshold every call is profiled and only slow ones are kept,
+    so it is not cheap in production, prefer sample_rate there.
+    """
+    def __init__(self, threshold=None, sample_rate=0.0, maxlen=100,
+                 limit=30, sort='cumulative'):
+        self.threshold = threshold
+        self.sample_rate = sample_rate
+        self.limit = limit
+        self.sort = sort
+        self.profiles = deque(maxlen=maxlen)
+
+    def setup(self, app, path='/_jrpc/profiles'):
+        """ Add debug endpoint with captured profiles to application """
+        app.router.add_route('GET', path, self.handler)
+        app.router.add_route('DELETE', path, self.handler)
+
+    async def handler(self, request):
+        """ Show captured profiles, clear buffer on DELETE """
+        profiles = list(self.profiles)
+        if 'DELETE' == request.method:
+            self.profiles.clear()
+        return Response(text=json.dumps(profiles),
+                        content_type='application/json')
+
+    async def call(self, data, coro):
+        """
+        Run service method and keep profile of it if needed.
+        cProfile stays enabled while coroutine method awaits, so its
+        profile includes other work done by the event loop meanwhile.
+        """
+        global _active
+        sampled = random.random() < self.sample_rate
+        if self.threshold is None and not sampled:
+            return (await coro)
+
+        # Only one cProfile may be enabled at a time, concurrent calls
+        # are just timed.
+        owner = not _active
+        prof = None
+        if owner:
+            _active = True
+            # Do not replace hook of another profiling tool
+            if sys.getprofile() is None:
+                prof = cProfile.Profile()
+
+        started = time.time()
+        start = time.perf_counter()
+        try:
+            if prof is not None:
+                try:
+                    prof.enable()
+                except ValueError:
+                    # Another tool is active on sys.monitoring (3.12+)
+                    prof = None
+            try:
+                return (await coro)
+            finally:
+                if prof is not None:
+                    prof.disable()
+        finally:
+            if owner:
+                _active = False
+            elapsed = time.perf_counter() - start
+            if sampled or elapsed >= self.threshold:
+                self.profiles.append({
+                    'method': data['method'],
+                    'params_size': len(json.dumps(data['params'],
+                                                  default=repr)),
+                    'started': started,
+                    'elapsed': elapsed,
+                    'sampled': sampled,
+                    'stats': self.stats(prof),
+                })
+
+    def stats(self, prof):
+        """ Dump profile to text """
+        if prof is None:
+            return None
+        out = io.StringIO()
+        pstats.Stats(prof, stream=out).sort_stats(
+            self.sort).print_stats(self.limit)
+        return out.getvalue()
@@ -0,0 +1,154 @@
+""" JSON-RPC server """
+from .exc import ParseError, InvalidRequest, InvalidParams, InternalError
+from .errors import JError, JResponse
+from .validator import validictory
+
+from functools import wraps
+import inspect
+
+REQ_JSONRPC20 = {
+    "type": "object",
+    "properties": {
+        "jsonrpc": {"pattern": r"2\.0"},
+        "method": {"type": "string"},
+        "params": {"type": "any"},
+        "id": {"type": "any"},
+    },
+}
+
+
+def coroutine(fun):
+    """ Wrap plain or async method, result is awaited if needed """
+    @wraps(fun)
+    async def wrapper(*args, **kw):
+        resp = fun(*args, **kw)
+        if inspect.isawaitable(resp):
+            resp = await resp
+        return resp
+    return wrapper
+
+
+async def jrpc_errorhandler_middleware(app, handler):
+    async def middleware(request):
+        try:
+            return (await handler(request))
+        except Exception:
+            import traceback
+            traceback.print_exc()
+            return JError().internal()
+    return middleware
+
+
+async def decode(request):
+    """ Get/decode/validate json from request """
+    vd = validictory()
+
+    try:
+        data = await request.json()
+    except Exception as err:
+        raise ParseError(err)
+
+    try:
+        vd.validate(data, REQ_JSONRPC20)
+    except vd.ValidationError as err:
+        raise InvalidRequest(err)
+    except vd.SchemaError as err:
+        raise InternalError(err)
+    except Exception as err:
+        raise InternalError(err)
+    return data
+
+
+class Service(object):
+    """ Service class """
+
+    profiler = None
+    # Not callable over JSON-RPC, as well as names starting with '_'
+    _reserved = ('setup', 'handler', 'valid', 'on_startup', 'on_shutdown',
+                 'profiler')
+
+    def __new__(cls, ctx):
+        """ Return on call class """
+        return cls.__run(cls, ctx)
+
+    @classmethod
+    def setup(cls, app, *args, **kw):
+        """
+        Create service instance shared across requests of application,
+        register its handler: add_route('POST', '/api', srv.handler)
+        """
+        srv = object.__new__(cls)
+        srv.__init__(*args, **kw)
+
+        async def startup(app):
+            await srv.on_startup(app)
+
+        async def shutdown(app):
+            await srv.on_shutdown(app)
+
+        app.on_startup.append(startup)
+        # Resources must live until running requests are finished
+        app.on_cleanup.append(shutdown)
+        return srv
+
+    async def handler(self, ctx):
+        """ Handle request by shared instance """
+        return (await self.__run(ctx))
+
+    async def on_startup(self, app):
+        """ Build shared resources on application startup """
+
+    async def on_shutdown(self, app):
+        """ Release shared resources on application cleanup """
+
+    def valid(schema=None):
+        """ Validation data by specific validictory configuration """
+        def dec(fun):
+            @wraps(fun)
+            def d_func(self, ctx, data, *a, **kw):
+                vd = validictory()
+                try:
+                    vd.validate(data['params'], schema)
+                except vd.ValidationError as err:
+                    raise InvalidParams(err)
+                except vd.SchemaError as err:
+                    raise InternalError(err)
+                return fun(self, ctx, data['params'], *a, **kw)
+            return d_func
+        return dec
+
+    async def __run(self, ctx):
+        """ Run service """
+        try:
+            data = await decode(ctx)
+        except ParseError:
+            return JError().parse()
+        except InvalidRequest:
+            return JError().request()
+        except InternalError:
+            return JError().internal()
+
+        # Methods are called unbound, class is self for legacy handler
+        cls = self if isinstance(self, type) else type(self)
+        try:
+            if (data['method'].startswith('_') or
+                    data['method'] in self._reserved):
+                raise AttributeError(data['method'])
+            i_app = getattr(cls, data['method'])
+            i_app = coroutine(i_app)
+        except Exception:
+            return JError(data).method()
+
+        try:
+            if self.profiler is not None:
+                resp = await self.profiler.call(data, i_app(self, ctx, data))
+            else:
+                resp = await i_app(self, ctx, data)
+        except InvalidParams:
+            return JError(data).params()
+        except InternalError:
+            return JError(data).internal()
+
+        return JResponse(jsonrpc={
+            "id": data['id'], "result": resp
+            })
@@ -0,0 +1,12 @@
+""" Lazy loaded validictory """
+
+_validictory = None
+
+
+def validictory():
+    """ Import validictory on first use and keep it """
+    global _validictory
+    if _validictory is None:
+        import validictory
+        _validictory = validictory
+    return _validictory
@@ -0,0 +1,56 @@
+import subprocess
+import sys
+import unittest
+
+# Modules added by bare 'import aiohttp_jrpc', currently 6 on Python 3.11
+MODULES_BUDGET = 10
+
+SIDES = ('aiohttp', 'aiohttp.client', 'aiohttp.web', 'validictory',
+         'aiohttp_jrpc.server', 'aiohttp_jrpc.client')
+
+
+def run(code):
+    """ Output of code run in fresh interpreter """
+    out = subprocess.check_output([sys.executable, '-c', code])
+    return out.decode().split()
+
+
+def loaded(code, modules):
+    """ Modules loaded by code run in fresh interpreter """
+    return run("{code}; import sys; print(' '.join(m for m in {mods!r} "
+               "if m in sys.modules))".format(code=code, mods=modules))
+
+
+class TestImport(unittest.TestCase):
+
+    def test_package(self):
+        self.assertEqual([], loaded("import aiohttp_jrpc", SIDES))
+
+    def test_budget(self):
+        added = run("import sys; before = set(sys.modules); "
+                    "import aiohttp_jrpc; "
+                    "print(' '.join(set(sys.modules) - before))")
+        self.assertLessEqual(len(added), MODULES_BUDGET, sorted(added))
+
+    def test_server(self):
+        # aiohttp always loads its client stack
+        self.assertEqual(['aiohttp', 'aiohttp.client', 'aiohttp.web',
+                          'aiohttp_jrpc.server'],
+                         loaded("from aiohttp_jrpc import Service", SIDES))
+
+    def test_client(self):
+        self.assertEqual(['aiohttp', 'aiohttp.client', 'aiohttp_jrpc.client'],
+                         loaded("from aiohttp_jrpc import Client", SIDES))
+
+    def test_validictory(self):
+        self.assertEqual(['validictory'], loaded(
+            "from aiohttp_jrpc import validate, ValidationError, SchemaError",
+            SIDES))
+
+    def test_star(self):
+        self.assertEqual(['Client', 'JError', 'ParseError', 'Service',
+                          'ValidationError'], run(
+            "from aiohttp_jrpc import *; "
+            "print(' '.join(n for n in sorted(dir()) if n in "
+            "('Service', 'Client', 'JError', 'ParseError', "
+            "'ValidationError', 'sys', 'import_module')))"))
@@ -0,0 +1,121 @@
+import asyncio
+import json
+from unittest import mock
+from aiohttp_jrpc import Profiler
+from utils import MyService, ServerTestCase
+from utils import create_response, create_request, NOT_FOUND
+
+
+class ProfiledService(MyService):
+    profiler = Profiler(threshold=0.0, maxlen=2)
+
+    async def slow(self, ctx, data):
+        await asyncio.sleep(0.05)
+        return "ok"
+
+
+class OtherService(ProfiledService):
+    profiler = Profiler(threshold=0.0)
+
+
+class TestProfiler(ServerTestCase):
+
+    def setUp(self):
+        super().setUp()
+        for service in (ProfiledService, OtherService):
+            service.profiler.threshold = 0.0
+            service.profiler.sample_rate = 0.0
+            service.profiler.profiles.clear()
+
+    async def request_wrapper(self, request):
+        return (await ProfiledService(request))
+
+    async def other_wrapper(self, request):
+        return (await OtherService(request))
+
+    def add_routes(self, app):
+        super().add_routes(app)
+        app.router.add_route('*', '/other', self.other_wrapper)
+        ProfiledService.profiler.setup(app)
+
+    async def post(self, url, method, rid=None):
+        resp = await self.client.post(
+            url, data=json.dumps(create_request(method, rid)))
+        return (await resp.json())
+
+    def test_profiles(self):
+        async def go():
+            app, srv, url = await self.create_server()
+            for rid in (1, 2, 3):
+                self.assertEqual(create_response(rid, {"a": "b"}),
+                                 (await self.post(url, "hello", rid)))
+            rsp = await self.post(url, "profiler")
+            self.assertEqual(NOT_FOUND['error']['code'], rsp['error']['code'])
+
+            resp = await self.client.get(url + '_jrpc/profiles')
+            self.assertEqual(200, resp.status)
+            profiles = await resp.json()
+            self.assertEqual(2, len(profiles))
+            self.assertEqual("hello", profiles[0]['method'])
+            self.assertEqual(len("null"), profiles[0]['params_size'])
+            self.assertFalse(profiles[0]['sampled'])
+            self.assertIn("function calls", profiles[0]['stats'])
+
+            resp = await self.client.delete(url + '_jrpc/profiles')
+            self.assertEqual(2, len((await resp.json())))
+            self.assertEqual(0, len(ProfiledService.profiler.profiles))
+
+        self.loop.run_until_complete(go())
+
+    def test_disabled(self):
+        async def go():
+            app, srv, url = await self.create_server()
+            ProfiledService.profiler.threshold = None
+            self.assertEqual(create_response(None, {"a": "b"}),
+                             (await self.post(url, "hello")))
+            self.assertEqual(0, len(ProfiledService.profiler.profiles))
+
+        self.loop.run_until_complete(go())
+
+    def test_sampling(self):
+        async def go():
+            app, srv, url = await self.create_server()
+            profiler = ProfiledService.profiler
+            profiler.threshold = None
+            profiler.sample_rate = 0.5
+
+            with mock.patch('aiohttp_jrpc.profiler.random.random',
+                            return_value=0.9):
+                await self.post(url, "hello")
+            self.assertEqual(0, len(profiler.profiles))
+
+            with mock.patch('aiohttp_jrpc.profiler.random.random',
+                            return_value=0.1):
+                await self.post(url, "hello")
+            self.assertEqual(1, len(profiler.profiles))
+            self.assertTrue(profiler.profiles[0]['sampled'])
+            self.assertIsNotNone(profiler.profiles[0]['stats'])
+
+        self.loop.run_until_complete(go())
+
+    def test_concurrent(self):
+        async def go():
+            app, srv, url = await self.create_server()
+            rsp = await asyncio.gather(self.post(url, "slow", 1),
+                                       self.post(url + 'other', "slow", 2))
+            self.assertEqual([create_response(1, "ok"),
+                              create_response(2, "ok")], rsp)
+
+            profiles = (list(ProfiledService.profiler.profiles) +
+                        list(OtherService.profiler.profiles))
+            self.assertEqual(2, len(profiles))
+            # Second call is only timed while first one is profiled
+            self.assertEqual(1, len([p for p in profiles if p['stats']]))
+            for prof in profiles:
+                self.assertGreaterEqual(prof['elapsed'], 0.05)
+
+            # Profiling is available again
+            await self.post(url + 'other', "slow", 3)
+            self.assertIsNotNone(OtherService.profiler.profiles[-1]['stats'])
+
+        self.loop.run_until_complete(go())
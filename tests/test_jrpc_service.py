@@ -1,54 +1,14 @@
-import asyncio
-import socket
-import unittest
 import json
-import aiohttp
 from aiohttp import web
 from aiohttp_jrpc import jrpc_errorhandler_middleware
-from utils import custom_errorhandler_middleware, MyService
+from utils import custom_errorhandler_middleware, SharedService
+from utils import ServerTestCase
 from utils import create_response, create_request
 from utils import (PARSE_ERROR, INVALID_REQUEST, NOT_FOUND, INVALID_PARAMS,
                    INTERNAL_ERROR, CUSTOM_ERROR_GT, CUSTOM_ERROR_LT)
 
 
-class TestService(unittest.TestCase):
-
-    def setUp(self):
-        self.loop = asyncio.new_event_loop()
-        asyncio.set_event_loop(None)
-        self.client = aiohttp.ClientSession(loop=self.loop)
-
-    def tearDown(self):
-        self.client.close()
-        self.loop.run_until_complete(self.handler.finish_connections())
-        self.srv.close()
-        self.loop.run_until_complete(self.srv.wait_closed())
-        self.loop.close()
-
-    def find_unused_port(self):
-        sock = socket.socket(socket.AF_INET, socket.SOCK_STREAM)
-        sock.bind(('127.0.0.1', 0))
-        port = sock.getsockname()[1]
-        sock.close()
-        return port
-
-    async def request_wrapper(self, request):
-        """ It's acctually need for tests on travis I could not reproduce """
-        return (await MyService(request))
-
-    async def create_server(self, middlewares=[]):
-        app = web.Application(loop=self.loop,
-                              middlewares=middlewares)
-
-        port = self.find_unused_port()
-        self.handler = app.make_handler(
-            debug=False, keep_alive_on=False)
-        app.router.add_route('*', '/', self.request_wrapper)
-        srv = await self.loop.create_server(
-            self.handler, '127.0.0.1', port)
-        url = "http://127.0.0.1:{}/".format(port)
-        self.srv = srv
-        return app, srv, url
+class TestService(ServerTestCase):
 
     def test_errors(self):
 
@@ -143,3 +103,31 @@ class TestService(unittest.TestCase):
         self.loop.run_until_complete(
             post(create_response("123", {"a": "b"}),
                  create_request("hello", "123")))
+
+    def test_shared_instance(self):
+        async def go():
+            app = web.Application()
+            service = SharedService.setup(app, "ok")
+            app.router.add_route('*', '/', service.handler)
+            self.assertEqual(None, service.cache)
+
+            srv = await self.start_server(app)
+            url = str(srv.make_url('/'))
+            for rid in (1, 2):
+                resp = await self.client.post(url, data=json.dumps(
+                    create_request("cached", rid)))
+                self.assertEqual(create_response(rid, {"data": "ok"}),
+                                 (await resp.json()))
+
+            for method in ("on_shutdown", "__init__", "__call__",
+                           "_reserved", "_Service__run"):
+                resp = await self.client.post(url, data=json.dumps(
+                    create_request(method)))
+                self.assertEqual(NOT_FOUND['error']['code'],
+                                 (await resp.json())['error']['code'])
+            self.assertEqual("ok", service.data)
+
+            await srv.close()
+            self.assertEqual(None, service.cache)
+
+        self.loop.run_until_complete(go())
@@ -1,4 +1,8 @@
 import asyncio
+import unittest
+import aiohttp
+from aiohttp import web
+from aiohttp.test_utils import TestServer
 from aiohttp_jrpc import Service, JError
 
 
@@ -77,6 +81,21 @@ class MyService(Service):
         raise LookupError("test custom middleware, exception is ok")
 
 
+class SharedService(Service):
+    def __init__(self, data):
+        self.data = data
+        self.cache = None
+
+    async def on_startup(self, app):
+        self.cache = {"data": self.data}
+
+    async def on_shutdown(self, app):
+        self.cache = None
+
+    def cached(self, ctx, data):
+        return self.cache
+
+
 def create_response(id=None, result=None):
     return {"jsonrpc": "2.0", "id": id, "result": result}
 
@@ -86,3 +105,43 @@ def create_request(method, id=None, params=None):
         "jsonrpc": "2.0", "id": id,
         "method": method, "params": params
     }
+
+
+class ServerTestCase(unittest.TestCase):
+    """ Test servers with MyService on / and client session """
+
+    def setUp(self):
+        self.loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self.loop)
+        self.client = self.loop.run_until_complete(self.create_session())
+        self.servers = []
+
+    def tearDown(self):
+        for srv in self.servers:
+            self.loop.run_until_complete(srv.close())
+        self.loop.run_until_complete(self.client.close())
+        self.loop.close()
+        asyncio.set_event_loop(None)
+
+    async def create_session(self):
+        return aiohttp.ClientSession()
+
+    async def request_wrapper(self, request):
+        """ It's acctually need for tests on travis I could not reproduce """
+        return (await MyService(request))
+
+    def add_routes(self, app):
+        app.router.add_route('*', '/', self.request_wrapper)
+
+    async def start_server(self, app):
+        """ Start app with its startup/cleanup lifecycle """
+        srv = TestServer(app)
+        await srv.start_server()
+        self.servers.append(srv)
+        return srv
+
+    async def create_server(self, middlewares=[]):
+        app = web.Application(middlewares=middlewares)
+        self.add_routes(app)
+        srv = await self.start_server(app)
+        return app, srv, str(srv.make_url('/'))